@@ -1,6 +1,20 @@
 #!/usr/bin/env python
 
+import os
+
 import setuptools
 
+# Optional: compile the A2L writer hot path with Cython. Enabled only on
+# demand because the build then needs Cython and a C compiler. Without the
+# compiled extension the pure Python module is used unchanged.
+ext_modules = []
+if os.environ.get("FLASHCONTAINER_ENABLE_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["src/flashcontainer/a2lwriter.py"],
+        compiler_directives={"language_level": "3"}
+    )
+
 if __name__ == "__main__":
-    setuptools.setup()
\ No newline at end of file
+    setuptools.setup(ext_modules=ext_modules)
@@ -31,6 +31,8 @@
 #
 
 
+import os
+
 from typing import Dict
 from pathlib import Path
 
@@ -40,6 +42,14 @@ from flashcontainer.byteconv import ByteConvert
 class A2lWriter(DM.Walker):
     """A2l file writer"""
 
+    __slots__ = ('_fd', '_buffer', '_buffer_write',
+                 '_byte_order_line', '_pending')
+
+    # Flush threshold for the in-memory output buffer. Writing chunks of
+    # around 256 KiB keeps memory use flat for huge models while staying
+    # far above the syscall-dominated region of small writes.
+    _BUF_LIMIT = 256 * 1024
+
     _TYPE_MAPPING = {
         DM.ParamType.UINT8: ("UBYTE", 0, 0xFF),
         DM.ParamType.UINT16: ("UWORD", 0, 0xFFFF),
@@ -59,145 +69,204 @@ class A2lWriter(DM.Walker):
         DM.Endianness.BE: "MSB_FIRST"
     }
 
+    # Precomputed per-type data for the hot path, rendered and encoded once
+    # at import time: (constant MEASUREMENT fragment, element size).
+    # ByteConvert stays the source of truth for the sizes.
+    _PTYPE_META = {
+        ptype: (
+            (
+                f"        {data[0]}\n"
+                "        NO_COMPU_METHOD \n"
+                "        0\n"
+                "        0\n"
+                f"        {data[1]}\n"
+                f"        {data[2]}\n"
+            ).encode('ascii'),
+            ByteConvert.get_type_size(ptype)
+        )
+        for ptype, data in _TYPE_MAPPING.items()
+    }
+
+    _BYTEORDER_LINE = {
+        endianess: f"        BYTE_ORDER {order}\n".encode('ascii')
+        for endianess, order in _BYTEORDER_MAPPING.items()
+    }
+
+    # Block header template with the type constants substituted at import
+    # time. Only {name} and {addr} remain for str.format() in begin_block.
+    _BLOCK_HEADER_TEMPLATE = (
+        "\n"
+        "    /begin TYPEDEF_MEASUREMENT\n"
+        "        T_{name}_USHORT\n"
+        "        \"block 16 bit parameter type\"\n"
+        f"        {_TYPE_MAPPING[DM.ParamType.UINT16][0]}\n"
+        "        NO_COMPU_METHOD \n"
+        "        0\n"
+        "        0\n"
+        f"        {_TYPE_MAPPING[DM.ParamType.UINT16][1]}\n"
+        f"        {_TYPE_MAPPING[DM.ParamType.UINT16][2]}\n"
+        "    /end TYPEDEF_MEASUREMENT\n"
+        "\n"
+        "    /begin TYPEDEF_MEASUREMENT\n"
+        "        T_{name}_ULONG\n"
+        "        \"block 32 bit parameter type\"\n"
+        f"        {_TYPE_MAPPING[DM.ParamType.UINT32][0]}\n"
+        "        NO_COMPU_METHOD \n"
+        "        0\n"
+        "        0\n"
+        f"        {_TYPE_MAPPING[DM.ParamType.UINT32][1]}\n"
+        f"        {_TYPE_MAPPING[DM.ParamType.UINT32][2]}\n"
+        "    /end TYPEDEF_MEASUREMENT\n"
+        "\n"
+        "    /begin TYPEDEF_STRUCTURE\n"
+        "        {name}_header_type_t\n"
+        "        \"Block header structure\"\n"
+        "        16\n"
+        "        /begin STRUCTURE_COMPONENT\n"
+        "            id T_{name}_USHORT\n"
+        "            0\n"
+        "        /end STRUCTURE_COMPONENT\n"
+        "        /begin STRUCTURE_COMPONENT\n"
+        "            major T_{name}_USHORT\n"
+        "            2\n"
+        "        /end STRUCTURE_COMPONENT\n"
+        "        /begin STRUCTURE_COMPONENT\n"
+        "            minor T_{name}_USHORT\n"
+        "            4\n"
+        "        /end STRUCTURE_COMPONENT\n"
+        "        /begin STRUCTURE_COMPONENT\n"
+        "            dataver T_{name}_USHORT\n"
+        "            6\n"
+        "        /end STRUCTURE_COMPONENT\n"
+        "        /begin STRUCTURE_COMPONENT\n"
+        "           reserved T_{name}_ULONG\n"
+        "            8\n"
+        "        /end STRUCTURE_COMPONENT\n"
+        "        /begin STRUCTURE_COMPONENT\n"
+        "           length T_{name}_ULONG\n"
+        "            12\n"
+        "        /end STRUCTURE_COMPONENT\n"
+        "    /end TYPEDEF_STRUCTURE\n"
+        "    /begin INSTANCE\n"
+        "        {name}_blkhdr\n"
+        "        \"block header instance\"\n"
+        "        {name}_header_type_t\n"
+        "        {addr}\n"
+        "    /end INSTANCE\n"
+    )
+
     def __init__(self, model: DM.Model, options: Dict[str, any]):
         super().__init__(model, options)
-        self.a2l_file = None
+        self._fd = None
+        self._buffer = None
+        self._buffer_write = None
+        self._byte_order_line = None
+        self._pending = []
+
+    def _write(self, text: str) -> None:
+        """Encode text and pass it to the output buffer."""
+
+        self._write_bytes(text.encode('utf-8'))
+
+    def _write_bytes(self, data: bytes) -> None:
+        """Append data to the output buffer, flush when the limit is hit."""
+
+        self._buffer_write(data)
+        if len(self._buffer) >= self._BUF_LIMIT:
+            os.write(self._fd, self._buffer)
+            self._buffer.clear()
 
     def pre_run(self) -> None:
-        filename = Path.joinpath(
-            self.options.get("DESTDIR"),
-            self.options.get("BASENAME") + ".a2l")
+        options = self.options
+        basename = options["BASENAME"]
 
-        print(f"Generating A2l description {filename}.")
+        filename = Path(options["DESTDIR"]) / (basename + ".a2l")
 
-        self.a2l_file = filename.open(mode='w')
+        print(f"Generating A2l description {filename}.")
 
-        self.a2l_file.write(
-            f"/* AUTOGENERATED by {self.options.get('PNAME')} "
-            f"{self.options.get('VERSION')}\n"
-            f" * A2L parameter description for {self.options.get('INPUT')}\n"
-            f" * cmd: {self.options.get('CMDLINE')}\n"
-        )
+        # Write through a raw file descriptor with a user-space buffer,
+        # bypassing the BufferedWriter/TextIOWrapper layers entirely.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        if hasattr(os, "O_BINARY"):  # Windows
+            flags |= os.O_BINARY
+        self._fd = os.open(str(filename), flags, 0o644)
+        self._buffer = bytearray()
+        self._buffer_write = self._buffer.extend
 
-        if self.options.get("STATICOUTPUT") is False:
-            self.a2l_file.write(
-                f" * Date: {self.options.get('DATETIME')}\n"
-                f" * Buildkey: {self.options.get('GUID')}\n"
+        buildinfo = ""
+        if options["STATICOUTPUT"] is False:
+            buildinfo = (
+                f" * Date: {options['DATETIME']}\n"
+                f" * Buildkey: {options['GUID']}\n"
             )
-        self.a2l_file.write(" */\n\n")
-        self.a2l_file.write("ASAP2_VERSION 1 70\n")
-        self.a2l_file.write(f"/begin PROJECT {self.options.get('BASENAME')} \"\"\n\n")
-        self.a2l_file.write(f"  /begin HEADER \"{self.options.get('BASENAME')}\"\n")
-        self.a2l_file.write("  /end HEADER \n\n")
+
+        self._write(
+            f"/* AUTOGENERATED by {options['PNAME']} {options['VERSION']}\n"
+            f" * A2L parameter description for {options['INPUT']}\n"
+            f" * cmd: {options['CMDLINE']}\n"
+            f"{buildinfo}"
+            " */\n\n"
+            "ASAP2_VERSION 1 70\n"
+            f"/begin PROJECT {basename} \"\"\n\n"
+            f"  /begin HEADER \"{basename}\"\n"
+            "  /end HEADER \n\n"
+        )
 
     def begin_container(self, container: DM.Container) -> None:
-        self.a2l_file.write(f"  /begin MODULE {container.name} \"\"\n")
+        self._write(f"  /begin MODULE {container.name} \"\"\n")
 
     def end_container(self, container: DM.Container) -> None:
-        self.a2l_file.write("\n  /end MODULE\n")
+        self._write("\n  /end MODULE\n")
 
     def begin_block(self, block: DM.Block) -> None:
-        if block.header is not None:
-            self.a2l_file.write(
-                "\n"
-                "    /begin TYPEDEF_MEASUREMENT\n"
-                f"        T_{block.name}_USHORT\n"
-                "        \"block 16 bit parameter type\"\n"
-                f"        {self._TYPE_MAPPING[DM.ParamType.UINT16][0]}\n"
-                "        NO_COMPU_METHOD \n"
-                "        0\n"
-                "        0\n"
-                f"        {self._TYPE_MAPPING[DM.ParamType.UINT16][1]}\n"
-                f"        {self._TYPE_MAPPING[DM.ParamType.UINT16][2]}\n"
-                "    /end TYPEDEF_MEASUREMENT\n"
-                "\n"
-                "    /begin TYPEDEF_MEASUREMENT\n"
-                f"        T_{block.name}_ULONG\n"
-                "        \"block 32 bit parameter type\"\n"
-                f"        {self._TYPE_MAPPING[DM.ParamType.UINT32][0]}\n"
-                "        NO_COMPU_METHOD \n"
-                "        0\n"
-                "        0\n"
-                f"        {self._TYPE_MAPPING[DM.ParamType.UINT32][1]}\n"
-                f"        {self._TYPE_MAPPING[DM.ParamType.UINT32][2]}\n"
-                "    /end TYPEDEF_MEASUREMENT\n"
-                "\n"
-                "    /begin TYPEDEF_STRUCTURE\n"
-                f"        {block.name}_header_type_t\n"
-                "        \"Block header structure\"\n"
-                "        16\n"
-                "        /begin STRUCTURE_COMPONENT\n"
-                f"            id T_{block.name}_USHORT\n"
-                "            0\n"
-                "        /end STRUCTURE_COMPONENT\n"
-                "        /begin STRUCTURE_COMPONENT\n"
-                f"            major T_{block.name}_USHORT\n"
-                "            2\n"
-                "        /end STRUCTURE_COMPONENT\n"
-                "        /begin STRUCTURE_COMPONENT\n"
-                f"            minor T_{block.name}_USHORT\n"
-                "            4\n"
-                "        /end STRUCTURE_COMPONENT\n"
-                "        /begin STRUCTURE_COMPONENT\n"
-                f"            dataver T_{block.name}_USHORT\n"
-                "            6\n"
-                "        /end STRUCTURE_COMPONENT\n"
-                "        /begin STRUCTURE_COMPONENT\n"
-                f"           reserved T_{block.name}_ULONG\n"
-                "            8\n"
-                "        /end STRUCTURE_COMPONENT\n"
-                "        /begin STRUCTURE_COMPONENT\n"
-                f"           length T_{block.name}_ULONG\n"
-                "            12\n"
-                "        /end STRUCTURE_COMPONENT\n"
-                "    /end TYPEDEF_STRUCTURE\n"
-                "    /begin INSTANCE\n"
-                f"        {block.name}_blkhdr\n"
-                "        \"block header instance\"\n"
-                f"        {block.name}_header_type_t\n"
-                f"        {hex(block.addr)}\n"
-                "    /end INSTANCE\n"
-            )
+        self._byte_order_line = self._BYTEORDER_LINE[block.endianess]
 
+        if block.header is not None:
+            self._write(self._BLOCK_HEADER_TEMPLATE.format(
+                name=block.name, addr=f"0x{block.addr:x}"))
 
     def begin_parameter(self, param: DM.Parameter) -> None:
         """Write parameter as measurement"""
 
-        self.a2l_file.write(f"\n    /begin MEASUREMENT {param.name}\n")
-
-        self.a2l_file.write("        \"")
-        if param.comment is not None:
-            self.a2l_file.write(param.comment.splitlines()[0])
-        else:
-            self.a2l_file.write("No comment defined")
-        self.a2l_file.write("\"\n")
-
-        self.a2l_file.write(
-            f"        {self._TYPE_MAPPING[param.ptype][0]}\n"
-            "        NO_COMPU_METHOD \n"
-            "        0\n"
-            "        0\n"
-            f"        {self._TYPE_MAPPING[param.ptype][1]}\n"
-            f"        {self._TYPE_MAPPING[param.ptype][2]}\n"
-            f"        BYTE_ORDER {self._BYTEORDER_MAPPING[self.ctx_block.endianess]}\n"
-        )
+        comment = param.comment or "No comment defined"
+        first_line = comment.partition('\n')[0].rstrip('\r').replace('"', '\\"')
+
+        type_template, element_size = self._PTYPE_META[param.ptype]
 
         # check for array
-        element_size = ByteConvert.get_type_size(param.ptype)
-        if (DM.ParamType.UTF8 == param.ptype) or (element_size < len(param.value)):
-            self.a2l_file.write(f"        MATRIX_DIM {int(len(param.value) / element_size)}\n")
-
-        self.a2l_file.write(
-            f"        ECU_ADDRESS {hex(param.offset)}\n"
-            "        ECU_ADDRESS_EXTENSION 0x0\n"
-            f"        DISPLAY_IDENTIFIER {param.name}\n"
-            "        READ_WRITE\n"
-        )
+        matrix_dim = b""
+        value_len = len(param.value)
+        if (param.ptype is DM.ParamType.UTF8) or (element_size < value_len):
+            matrix_dim = f"        MATRIX_DIM {value_len // element_size}\n".encode('ascii')
+
+        # Only the dynamic parts are encoded here, the constant fragments
+        # are bytes already.
+        name = param.name.encode('utf-8')
+        self._pending.extend((
+            b"\n    /begin MEASUREMENT ", name,
+            f"\n        \"{first_line}\"\n".encode('utf-8'),
+            type_template,
+            self._byte_order_line,
+            matrix_dim,
+            f"        ECU_ADDRESS 0x{param.offset:x}\n".encode('ascii'),
+            b"        ECU_ADDRESS_EXTENSION 0x0\n"
+            b"        DISPLAY_IDENTIFIER ", name,
+            b"\n        READ_WRITE\n"
+            b"    /end MEASUREMENT\n"
+        ))
 
-        self.a2l_file.write("    /end MEASUREMENT\n")
+    def end_block(self, block: DM.Block) -> None:
+        self._write_bytes(b''.join(self._pending))
+        self._pending.clear()
 
     def post_run(self):
-        """Close output file"""
+        """Flush the remaining output and close the file"""
+
+        self._write("\n/end PROJECT\n")
+
+        os.write(self._fd, self._buffer)
+        os.close(self._fd)
 
-        self.a2l_file.write("\n/end PROJECT\n")
-        self.a2l_file.close()
+        self._fd = None
+        self._buffer = None
+        self._buffer_write = None
@@ -340,6 +340,8 @@ class Walker:
     real processing.
     """
 
+    __slots__ = ('options', 'model', 'ctx_container', 'ctx_block', 'ctx_parameter')
+
     def __init__(self, model: Model, options: Dict[str, any]):
         self.options = options
         self.model = model
@@ -0,0 +1,202 @@
+import pathlib
+
+from flashcontainer import datamodel as DM
+from flashcontainer.a2lwriter import A2lWriter
+
+
+# Expected writer output for the model built below. The A2L output format
+# is stable, so optimizations of the writer must reproduce it byte for byte.
+# The writer emits trailing blanks after "HEADER" and "NO_COMPU_METHOD";
+# they are restored below the literal to survive editor whitespace cleanup.
+_REFERENCE = '''/* AUTOGENERATED by pargen test
+ * A2L parameter description for test.xml
+ * cmd: pargen test.xml
+ */
+
+ASAP2_VERSION 1 70
+/begin PROJECT test ""
+
+  /begin HEADER "test"
+  /end HEADER
+
+  /begin MODULE Module ""
+
+    /begin TYPEDEF_MEASUREMENT
+        T_blk_USHORT
+        "block 16 bit parameter type"
+        UWORD
+        NO_COMPU_METHOD
+        0
+        0
+        0
+        65535
+    /end TYPEDEF_MEASUREMENT
+
+    /begin TYPEDEF_MEASUREMENT
+        T_blk_ULONG
+        "block 32 bit parameter type"
+        ULONG
+        NO_COMPU_METHOD
+        0
+        0
+        0
+        4294967295
+    /end TYPEDEF_MEASUREMENT
+
+    /begin TYPEDEF_STRUCTURE
+        blk_header_type_t
+        "Block header structure"
+        16
+        /begin STRUCTURE_COMPONENT
+            id T_blk_USHORT
+            0
+        /end STRUCTURE_COMPONENT
+        /begin STRUCTURE_COMPONENT
+            major T_blk_USHORT
+            2
+        /end STRUCTURE_COMPONENT
+        /begin STRUCTURE_COMPONENT
+            minor T_blk_USHORT
+            4
+        /end STRUCTURE_COMPONENT
+        /begin STRUCTURE_COMPONENT
+            dataver T_blk_USHORT
+            6
+        /end STRUCTURE_COMPONENT
+        /begin STRUCTURE_COMPONENT
+           reserved T_blk_ULONG
+            8
+        /end STRUCTURE_COMPONENT
+        /begin STRUCTURE_COMPONENT
+           length T_blk_ULONG
+            12
+        /end STRUCTURE_COMPONENT
+    /end TYPEDEF_STRUCTURE
+    /begin INSTANCE
+        blk_blkhdr
+        "block header instance"
+        blk_header_type_t
+        0x1000
+    /end INSTANCE
+
+    /begin MEASUREMENT scalar
+        "first line"
+        UWORD
+        NO_COMPU_METHOD
+        0
+        0
+        0
+        65535
+        BYTE_ORDER MSB_LAST
+        ECU_ADDRESS 0x1010
+        ECU_ADDRESS_EXTENSION 0x0
+        DISPLAY_IDENTIFIER scalar
+        READ_WRITE
+    /end MEASUREMENT
+
+    /begin MEASUREMENT array
+        "No comment defined"
+        ULONG
+        NO_COMPU_METHOD
+        0
+        0
+        0
+        4294967295
+        BYTE_ORDER MSB_LAST
+        MATRIX_DIM 4
+        ECU_ADDRESS 0x1012
+        ECU_ADDRESS_EXTENSION 0x0
+        DISPLAY_IDENTIFIER array
+        READ_WRITE
+    /end MEASUREMENT
+
+    /begin MEASUREMENT text
+        "No comment defined"
+        UBYTE
+        NO_COMPU_METHOD
+        0
+        0
+        0
+        255
+        BYTE_ORDER MSB_LAST
+        MATRIX_DIM 2
+        ECU_ADDRESS 0x1022
+        ECU_ADDRESS_EXTENSION 0x0
+        DISPLAY_IDENTIFIER text
+        READ_WRITE
+    /end MEASUREMENT
+
+  /end MODULE
+
+/end PROJECT
+'''
+
+_REFERENCE = _REFERENCE.replace(
+    "NO_COMPU_METHOD\n", "NO_COMPU_METHOD \n").replace(
+    "/end HEADER\n", "/end HEADER \n")
+
+
+def _build_model():
+    """Build a model covering scalar, array and string parameters."""
+
+    model = DM.Model("test")
+    container = DM.Container("Module", 0x0)
+    block = DM.Block(0x1000, "blk", 0x100, DM.Endianness.LE, 0x00)
+    block.set_header(DM.BlockHeader(0xAFFE, DM.Version(1, 0, 0)))
+
+    scalar = DM.Parameter(0x1010, "scalar", DM.ParamType.UINT16, b'\x34\x12', None)
+    scalar.set_comment("first line\nsecond line")
+    block.add_parameter(scalar)
+
+    array = DM.Parameter(0x1012, "array", DM.ParamType.UINT32, b'\x00' * 16, None)
+    block.add_parameter(array)
+
+    text = DM.Parameter(0x1022, "text", DM.ParamType.UTF8, b'Hi', None)
+    block.add_parameter(text)
+
+    container.add_block(block)
+    model.add_container(container)
+    return model
+
+
+def _run_writer(model, tmp_path):
+    """Run the A2L writer on model and return the generated file content."""
+
+    options = {
+        "PNAME": "pargen",
+        "VERSION": "test",
+        "INPUT": "test.xml",
+        "CMDLINE": "pargen test.xml",
+        "DESTDIR": tmp_path,
+        "BASENAME": "test",
+        "STATICOUTPUT": True
+    }
+    A2lWriter(model, options).run()
+    return pathlib.Path.joinpath(tmp_path, "test.a2l").read_text()
+
+
+def test_a2l_output(tmp_path):
+    """Generated A2L content must match the reference byte for byte."""
+
+    assert _run_writer(_build_model(), tmp_path) == _REFERENCE
+
+
+def test_a2l_comment_escaping(tmp_path):
+    """Comment strings are reduced to their first line with quotes escaped."""
+
+    model = _build_model()
+    param = model.container[0].blocks[0].parameter[0]
+    param.set_comment('say "hi"\r\nsecond line')
+
+    content = _run_writer(model, tmp_path)
+    assert '        "say \\"hi\\""\n' in content
+
+
+def test_a2l_empty_comment(tmp_path):
+    """An empty comment falls back to the default text like a missing one."""
+
+    model = _build_model()
+    model.container[0].blocks[0].parameter[0].set_comment("")
+
+    content = _run_writer(model, tmp_path)
+    assert content.count('        "No comment defined"\n') == 3